@@ -3,9 +3,25 @@ import pandas as pd
 import io
 import time
 import json
+import os
 import plotly.express as px
 import plotly.graph_objects as go
-from validator import validate_email
+from validator import validate_email_list
+from delta import load_previous_results, plan_revalidation, remaining_plan, normalize_email
+from result_store import ResultStore, list_runs, delete_run, DELIVERABILITY_CODES
+from stats import ValidationStats, STATS_COLUMNS
+
+# Jumlah hasil yang ditulis ke ResultStore sekaligus
+STORE_BATCH_SIZE = 100
+
+# Interval maksimum (detik) antar micro-batch hasil yang ditampilkan selama validasi
+STREAM_INTERVAL = 2.0
+
+# Jumlah baris per halaman pada tabel hasil
+TABLE_PAGE_SIZE = 1000
+
+# Jumlah baris yang diformat sekaligus saat menulis ekspor CSV
+EXPORT_CHUNK_SIZE = 100000
 
 st.set_page_config(
     page_title="Email Validator Tool",
@@ -56,9 +72,84 @@ def main():
         """
     )
     
+    # Mode delta: validasi ulang hanya email yang berubah
+    st.sidebar.title("Mode Delta")
+    previous_file = st.sidebar.file_uploader(
+        "Hasil validasi sebelumnya (opsional)",
+        type=["csv"],
+        help="Upload CSV hasil ekspor sebelumnya. Hanya email baru, verdict yang kedaluwarsa, "
+             "atau berstatus RISKY/UNKNOWN/FAILED yang akan divalidasi ulang."
+    )
+    st.session_state.delta_max_age_days = st.sidebar.number_input(
+        "Masa berlaku verdict (hari)", min_value=1, value=30, step=1
+    )
+    if previous_file is not None:
+        baseline_key = ('upload', previous_file.name, previous_file.size)
+        baseline_source = previous_file
+    elif st.session_state.get('delta_run_path'):
+        baseline_key = ('run', st.session_state.delta_run_path)
+        baseline_source = st.session_state.delta_run_path
+        st.sidebar.caption(f"Acuan: {os.path.basename(baseline_source)}")
+        st.sidebar.button("Lepas Acuan Run", on_click=set_delta_run, args=(None,))
+    else:
+        baseline_key = None
+        baseline_source = None
+    
+    # Acuan hanya dibaca ulang jika sumbernya berubah
+    if baseline_key != st.session_state.get('previous_results_key'):
+        st.session_state.previous_results_key = baseline_key
+        st.session_state.previous_results = None
+        st.session_state.previous_results_error = None
+        if baseline_source is not None:
+            try:
+                st.session_state.previous_results = load_previous_results(baseline_source)
+            except Exception as e:
+                st.session_state.previous_results_error = str(e)
+    if st.session_state.get('previous_results') is not None:
+        st.sidebar.success(f"Memuat {len(st.session_state.previous_results)} hasil sebelumnya.")
+    elif st.session_state.get('previous_results_error'):
+        st.sidebar.error(f"Error membaca hasil sebelumnya: {st.session_state.previous_results_error}")
+    
+    # Penyimpanan hasil dalam format biner kolumnar (memory-mapped)
+    st.sidebar.title("Penyimpanan Hasil")
+    st.session_state.keep_raw_payloads = st.sidebar.checkbox(
+        "Simpan payload API mentah (terkompresi)",
+        value=False,
+        help="Payload lengkap dari API disimpan terkompresi untuk tampilan detail. "
+             "Tanpa opsi ini hanya kolom ringkas yang disimpan."
+    )
+    saved_runs = list_runs()
+    if saved_runs:
+        selected_run = st.sidebar.selectbox(
+            "Run tersimpan",
+            saved_runs,
+            format_func=os.path.basename
+        )
+        # Run yang sedang ditampilkan atau ditulis tidak boleh dihapus
+        run_in_use = is_run_in_use(selected_run)
+        confirm_remove = st.sidebar.checkbox(
+            "Konfirmasi hapus run terpilih",
+            key="confirm_remove_run",
+            disabled=run_in_use,
+            help="Run yang sedang dipakai di tab Hasil tidak dapat dihapus." if run_in_use else None
+        )
+        col1, col2, col3 = st.sidebar.columns(3)
+        col1.button("Muat", on_click=load_run, args=(selected_run,))
+        col2.button("Acuan Delta", on_click=set_delta_run, args=(selected_run,))
+        col3.button("Hapus", on_click=remove_run, args=(selected_run,), disabled=run_in_use or not confirm_remove)
+        if st.session_state.get('load_run_error'):
+            st.sidebar.error(f"Error memuat run: {st.session_state.pop('load_run_error')}")
+        if st.session_state.get('remove_run_error'):
+            st.sidebar.error(st.session_state.pop('remove_run_error'))
+    
     # Tab untuk input
     tabs = st.tabs(["Upload CSV", "Input Manual", "Hasil"])
     
+    # Area tab Hasil dibuat lebih dulu agar hasil dapat ditampilkan selama validasi berjalan
+    with tabs[2]:
+        controls_area = st.empty()
+        results_area = st.empty()
+    
     # Tab Upload CSV
     with tabs[0]:
         st.header("Upload File CSV")
@@ -84,7 +175,7 @@ def main():
                     # Tombol untuk proses validasi
                     if st.button("Validasi Email", key="validate_csv"):
                         with st.spinner("Memvalidasi email..."):
-                            validate_emails()
+                            validate_emails(results_area, controls_area)
             except Exception as e:
                 st.error(f"Error membaca file CSV: {e}")
     
@@ -106,39 +197,89 @@ def main():
                 st.session_state.emails_to_validate = email_list
                 
                 with st.spinner("Memvalidasi email..."):
-                    validate_emails()
+                    validate_emails(results_area, controls_area)
             else:
                 st.warning("Harap masukkan minimal satu email untuk divalidasi.")
     
+    # Validasi yang belum selesai dilanjutkan otomatis setelah rerun (mis. karena
+    # download hasil sementara), kecuali dihentikan oleh pengguna
+    store = st.session_state.get('validation_store')
+    if (store is not None and len(store) < store.capacity
+            and st.session_state.get('validation_plan') is not None):
+        if st.session_state.get('validation_active'):
+            with tabs[2]:
+                with st.spinner("Melanjutkan validasi email..."):
+                    validate_emails(results_area, controls_area, resume=True)
+        else:
+            with controls_area.container():
+                st.warning(f"Validasi dihentikan pada {len(store)}/{store.capacity} email.")
+                st.button("Lanjutkan Validasi", key="resume_validation", on_click=set_validation_active, args=(True,))
+    
     # Tab Hasil
-    with tabs[2]:
-        if 'validation_results' in st.session_state:
+    with results_area.container():
+        if 'validation_store' in st.session_state:
             st.header("Hasil Validasi Email")
             
-            # Konversi hasil validasi ke dataframe
-            results = st.session_state.validation_results
+            # Hasil dibaca secara lazy dari file memory-mapped
+            store = st.session_state.validation_store
             
-            # Ekstrak data API untuk analisis
-            api_data = extract_api_data(results)
-            
-            # Buat dataframe dari hasil ekstraksi
-            if api_data:
-                results_df = pd.DataFrame(api_data)
-                
-                # Dashboard analisis hasil validasi
-                display_validation_dashboard(results_df)
+            if len(store) > 0:
+                # Dashboard analisis hasil validasi dari agregat inkremental
+                display_validation_dashboard(st.session_state.validation_stats)
                 
                 # Tampilkan tabel hasil
-                display_validation_table(results_df)
+                display_validation_table(store)
                 
                 # Detail validasi untuk email yang dipilih
-                display_email_details(results)
+                display_email_details(store)
             else:
                 st.error("Tidak dapat mengekstrak data API dari hasil validasi.")
         else:
             st.info("Belum ada hasil validasi. Silakan validasi email terlebih dahulu di tab Upload CSV atau Input Manual.")
 
 
+def load_run(path):
+    """
+    Memuat run tersimpan sebagai hasil validasi yang ditampilkan
+    """
+    try:
+        st.session_state.validation_store = ResultStore(path)
+        st.session_state.validation_stats = ValidationStats.from_store(st.session_state.validation_store)
+        st.session_state.validation_emails = None
+        st.session_state.validation_plan = None
+    except Exception as e:
+        st.session_state.load_run_error = str(e)
+
+
+def set_delta_run(path):
+    """
+    Menjadikan run tersimpan sebagai acuan Mode Delta (None untuk melepas)
+    """
+    st.session_state.delta_run_path = path
+
+
+def is_run_in_use(path):
+    """
+    Mengecek apakah run sedang dipakai sebagai hasil validasi (termasuk yang masih ditulis)
+    """
+    store = st.session_state.get('validation_store')
+    return store is not None and os.path.abspath(store.path) == os.path.abspath(path)
+
+
+def remove_run(path):
+    """
+    Menghapus run tersimpan beserta file pendampingnya
+    """
+    st.session_state.confirm_remove_run = False
+    if is_run_in_use(path):
+        # File yang masih dipakai akan terus ditulis setelah dihapus dan hasilnya hilang
+        st.session_state.remove_run_error = "Run yang sedang dipakai di tab Hasil tidak dapat dihapus."
+        return
+    if st.session_state.get('delta_run_path') == path:
+        st.session_state.delta_run_path = None
+    delete_run(path)
+
+
 def extract_api_data(validation_results):
     """
     Ekstrak dan strukturkan data penting dari hasil API untuk dianalisis
@@ -153,6 +294,7 @@ def extract_api_data(validation_results):
         entry = {
             'email': email,
             'category': result.get('category', 'unknown'),
+            'validated_at': result.get('validated_at', ''),
         }
         
         # Jika api_result tersedia, tambahkan detail validasi
@@ -189,32 +331,32 @@ def extract_api_data(validation_results):
     return api_data
 
 
-def display_validation_dashboard(df):
+def display_validation_dashboard(stats):
     """
-    Menampilkan dashboard dengan chart dan statistik dari hasil validasi
+    Menampilkan dashboard dengan chart dan statistik dari agregat hasil validasi
     """
     st.subheader("Dashboard Validasi Email")
     
     # Statistik Ringkasan
     col1, col2, col3, col4 = st.columns(4)
     
-    total = len(df)
+    total = stats.total
+    flags = stats.flag_counts
     
     with col1:
-        deliverable = sum(df['deliverability'] == 'DELIVERABLE')
+        deliverable = stats.deliverability_counts.get('DELIVERABLE', 0)
         st.metric("Deliverable", f"{deliverable}/{total}", f"{deliverable/total*100:.1f}%")
     
     with col2:
-        valid_format = sum(df['is_valid_format'].fillna(False))
+        valid_format = flags['is_valid_format']
         st.metric("Format Valid", f"{valid_format}/{total}", f"{valid_format/total*100:.1f}%")
     
     with col3:
-        valid_mx = sum(df['has_mx_record'].fillna(False))
+        valid_mx = flags['has_mx_record']
         st.metric("MX Record Valid", f"{valid_mx}/{total}", f"{valid_mx/total*100:.1f}%")
     
     with col4:
-        # Handle None values before applying ~ operator
-        non_disposable = total - sum(df['is_disposable'].fillna(False))
+        non_disposable = total - flags['is_disposable']
         st.metric("Non-Disposable", f"{non_disposable}/{total}", f"{non_disposable/total*100:.1f}%")
     
     # Chart Baris 1: Deliverability dan Kategori Email
@@ -222,8 +364,9 @@ def display_validation_dashboard(df):
     
     with col1:
         st.markdown("#### Deliverability Status")
-        deliverability_counts = df['deliverability'].value_counts().reset_index()
-        deliverability_counts.columns = ['deliverability', 'count']
+        deliverability_counts = pd.DataFrame(
+            list(stats.deliverability_counts.items()), columns=['deliverability', 'count']
+        )
         
         fig = px.pie(deliverability_counts, names='deliverability', values='count', 
                      color='deliverability',
@@ -238,8 +381,9 @@ def display_validation_dashboard(df):
     
     with col2:
         st.markdown("#### Email Category")
-        category_counts = df['category'].value_counts().reset_index()
-        category_counts.columns = ['category', 'count']
+        category_counts = pd.DataFrame(
+            list(stats.category_counts.items()), columns=['category', 'count']
+        )
         
         fig = px.pie(category_counts, names='category', values='count',
                      title='Business vs Personal Emails')
@@ -251,28 +395,27 @@ def display_validation_dashboard(df):
     with col1:
         st.markdown("#### Validasi Parameter")
         
-        # Hitung jumlah email yang memenuhi setiap parameter validasi
-        # Handle None values with fillna(False) before applying ~ operator
+        # Jumlah email yang memenuhi setiap parameter validasi
         validation_data = {
             'Parameter': [
                 'Format Valid', 'MX Record Valid', 'SMTP Valid', 
                 'Non-Disposable', 'Non-Role Email', 'Non-Catchall'
             ],
             'Valid': [
-                sum(df['is_valid_format'].fillna(False)),
-                sum(df['has_mx_record'].fillna(False)),
-                sum(df['is_smtp_valid'].fillna(False)),
-                sum(~df['is_disposable'].fillna(False)),
-                sum(~df['is_role_email'].fillna(False)),
-                sum(~df['is_catchall'].fillna(False))
+                flags['is_valid_format'],
+                flags['has_mx_record'],
+                flags['is_smtp_valid'],
+                total - flags['is_disposable'],
+                total - flags['is_role_email'],
+                total - flags['is_catchall']
             ],
             'Invalid': [
-                sum(~df['is_valid_format'].fillna(False)),
-                sum(df['has_mx_record'].fillna(False) == False),
-                sum(df['is_smtp_valid'].fillna(False) == False),
-                sum(df['is_disposable'].fillna(False)),
-                sum(df['is_role_email'].fillna(False)),
-                sum(df['is_catchall'].fillna(False))
+                total - flags['is_valid_format'],
+                total - flags['has_mx_record'],
+                total - flags['is_smtp_valid'],
+                flags['is_disposable'],
+                flags['is_role_email'],
+                flags['is_catchall']
             ]
         }
         
@@ -290,11 +433,9 @@ def display_validation_dashboard(df):
     with col2:
         st.markdown("#### Quality Score Distribution")
         
-        # Histogram Quality Score
-        fig = px.histogram(df, x='quality_score', 
-                          title='Distribusi Quality Score', 
-                          range_x=[0, 1],
-                          nbins=10)
+        # Histogram Quality Score dari bin yang sudah dihitung
+        fig = px.bar(stats.histogram_frame(), x='quality_score', y='count',
+                     title='Distribusi Quality Score')
         fig.update_traces(marker_color='#636EFA')
         st.plotly_chart(fig, use_container_width=True)
 
@@ -306,6 +447,10 @@ def format_csv_export(df):
     # Buat copy dataframe untuk format ekspor
     export_df = df.copy()
     
+    # Format waktu validasi sebagai ISO 8601
+    if 'validated_at' in export_df.columns and pd.api.types.is_datetime64_any_dtype(export_df['validated_at']):
+        export_df['validated_at'] = export_df['validated_at'].dt.strftime('%Y-%m-%dT%H:%M:%S').fillna('')
+    
     # Format quality_score sebagai persentase
     export_df['quality_score'] = export_df['quality_score'].apply(
         lambda x: f"{float(x)*100:.1f}%" if isinstance(x, (int, float)) else x
@@ -338,7 +483,8 @@ def format_csv_export(df):
         'is_catchall': 'Bukan Email Catchall',
         'has_mx_record': 'Memiliki MX Record',
         'is_smtp_valid': 'SMTP Valid',
-        'autocorrect': 'Saran Koreksi'
+        'autocorrect': 'Saran Koreksi',
+        'validated_at': 'Waktu Validasi'
     })
     
     # Atur urutan kolom
@@ -346,21 +492,50 @@ def format_csv_export(df):
         'Email', 'Jenis Email', 'Status Deliverability', 'Skor Kualitas (%)', 
         'Format Email Valid', 'Memiliki MX Record', 'SMTP Valid', 
         'Bukan Email Disposable', 'Email Layanan Gratis', 'Bukan Email Peran', 
-        'Bukan Email Catchall', 'Saran Koreksi'
+        'Bukan Email Catchall', 'Saran Koreksi', 'Waktu Validasi'
     ]
     
     export_df = export_df[[col for col in column_order if col in export_df.columns]]
     return export_df
 
 
-def display_validation_table(df):
+def export_path(store):
+    """
+    Path file CSV ekspor yang disimpan di samping file run
+    """
+    return os.path.splitext(store.path)[0] + '.csv'
+
+
+def write_csv_export(store):
+    """
+    Menulis ekspor CSV dari ResultStore per blok, atau memakai file yang sudah
+    ada jika masih lebih baru dari file run
+    """
+    path = export_path(store)
+    if os.path.exists(path) and os.path.getmtime(path) >= os.path.getmtime(store.path):
+        return path
+    
+    with open(path, 'w', newline='', encoding='utf-8') as csv_file:
+        for start in range(0, len(store), EXPORT_CHUNK_SIZE):
+            export_df = format_csv_export(store.to_dataframe(start, start + EXPORT_CHUNK_SIZE))
+            export_df.to_csv(csv_file, index=False, header=start == 0)
+    return path
+
+
+def display_validation_table(store):
     """
-    Menampilkan tabel hasil validasi email
+    Menampilkan tabel hasil validasi email per halaman dari ResultStore
     """
     st.subheader("Tabel Hasil Validasi")
     
-    # Buat copy dataframe untuk tampilan
-    display_df = df.copy()
+    # Baca hanya baris pada halaman yang dipilih
+    total_pages = max(1, -(-len(store) // TABLE_PAGE_SIZE))
+    page = 1
+    if total_pages > 1:
+        page = st.number_input(f"Halaman (1-{total_pages})", min_value=1, max_value=total_pages, value=1, step=1)
+    start = (page - 1) * TABLE_PAGE_SIZE
+    display_df = store.to_dataframe(start, start + TABLE_PAGE_SIZE)
+    failed_count = int((store.records['deliverability'][:len(store)] == DELIVERABILITY_CODES.index('FAILED')).sum())
     
     # Format quality_score sebagai persentase
     display_df['quality_score'] = display_df['quality_score'].apply(lambda x: f"{float(x)*100:.1f}%" if isinstance(x, (int, float)) else x)
@@ -411,7 +586,7 @@ def display_validation_table(df):
     st.write(display_df.to_html(escape=False), unsafe_allow_html=True)
     
     # Tambahkan penjelasan untuk status FAILED
-    if 'FAILED' in df['deliverability'].values:
+    if failed_count > 0:
         st.warning("""
         ⚠️ **Catatan:** Email dengan status **FAILED** tidak berhasil divalidasi oleh API. Ini bisa disebabkan oleh:
         - Rate limit dari API (terlalu banyak request dalam waktu singkat)
@@ -421,35 +596,40 @@ def display_validation_table(df):
         Coba validasi ulang email tersebut secara terpisah atau setelah beberapa saat.
         """)
     
-    # Format dan download hasil sebagai CSV
-    export_df = format_csv_export(df)
-    csv = export_df.to_csv(index=False)
-    
-    st.download_button(
-        label="Download Hasil sebagai CSV",
-        data=csv,
-        file_name="email_validation_results.csv",
-        mime="text/csv"
-    )
+    # CSV hanya dibuat saat diminta, bukan di setiap interaksi
+    if st.button("Siapkan CSV untuk Download", key="prepare_export"):
+        with st.spinner("Menyiapkan CSV..."):
+            path = write_csv_export(store)
+        with open(path, 'rb') as csv_file:
+            st.download_button(
+                label="Download Hasil sebagai CSV",
+                data=csv_file,
+                file_name="email_validation_results.csv",
+                mime="text/csv"
+            )
 
 
-def display_email_details(results):
+def display_email_details(store):
     """
     Menampilkan detail validasi untuk email yang dipilih
     """
     st.subheader("Detail Validasi Email")
     
-    # Buat list email yang valid untuk dropdown
-    email_list = []
-    for result in results:
-        if result.get('api_validation'):
-            email_list.append(result.get('email'))
+    # Cari satu baris berdasarkan email atau nomor baris, tanpa memuat seluruh email
+    col1, col2 = st.columns(2)
+    with col1:
+        lookup = st.text_input("Cari email untuk melihat detail validasi:").strip()
+    with col2:
+        row_number = st.number_input(
+            f"Atau pilih nomor baris (1-{len(store)}):",
+            min_value=1, max_value=max(1, len(store)), value=1, step=1
+        )
+    selected_index = store.find(lookup) if lookup else row_number - 1
     
-    if email_list:
-        selected_email = st.selectbox("Pilih email untuk melihat detail validasi:", email_list)
-        
-        # Cari hasil validasi untuk email yang dipilih
-        selected_result = next((r for r in results if r.get('email') == selected_email), None)
+    if selected_index is not None:
+        # Baca hasil validasi untuk email yang dipilih dari store
+        selected_result = store.get_result(selected_index)
+        selected_email = selected_result.get('email')
         
         if selected_result and selected_result.get('api_validation'):
             api_result = selected_result.get('api_validation')
@@ -587,52 +767,184 @@ def display_email_details(results):
         else:
             st.error(f"Tidak dapat menemukan detail validasi untuk email: {selected_email}")
     else:
-        st.info("Tidak ada data validasi API tersedia untuk ditampilkan.")
+        st.info(f"Email {lookup} tidak ditemukan dalam hasil validasi.")
 
 
-def validate_emails():
+def write_results(store, stats, results):
     """
-    Fungsi untuk memvalidasi daftar email menggunakan API dan menyimpan hasilnya ke session state
+    Menulis satu micro-batch hasil validate_email() ke ResultStore dan
+    memperbarui agregat dashboard serta file ekspor CSV secara inkremental
     """
-    if 'emails_to_validate' not in st.session_state:
-        st.error("Tidak ada email untuk divalidasi.")
+    if not results:
         return
     
-    emails = st.session_state.emails_to_validate
+    # Hasil yang diteruskan dari mode delta tidak memiliki payload API mentah
+    raw_payloads = [None if r.get('carried_forward') else r.get('api_validation') for r in results]
+    start = len(store)
+    store.append(extract_api_data(results), raw_payloads)
+    
+    # Hanya baris baru yang dihitung dan ditulis ke file ekspor di samping run
+    batch_df = store.to_dataframe(start)
+    stats.update(batch_df[STATS_COLUMNS])
+    with open(export_path(store), 'w' if start == 0 else 'a', newline='', encoding='utf-8') as csv_file:
+        format_csv_export(batch_df).to_csv(csv_file, index=False, header=start == 0)
+
+
+def display_partial_results(results_area, store, stats):
+    """
+    Menampilkan hasil yang sudah selesai di tab Hasil selama validasi berjalan
+    """
+    with results_area.container():
+        st.header("Hasil Validasi Email")
+        st.info(f"⏳ Validasi sedang berjalan: {len(store)}/{store.capacity} hasil tersedia.")
+        
+        display_validation_dashboard(stats)
+        
+        st.caption(f"Hasil sementara ditulis bertahap ke `{export_path(store)}`.")
+        
+        # Pratinjau hasil terbaru
+        st.subheader("Hasil Terbaru")
+        st.dataframe(format_csv_export(store.to_dataframe(max(0, len(store) - 20))))
+
+
+def request_partial_export():
+    """
+    Menandai permintaan download hasil sementara untuk rerun berikutnya
+    """
+    st.session_state.partial_export_requested = True
+
+
+def set_validation_active(active):
+    """
+    Menjalankan atau menghentikan validasi yang belum selesai
+    """
+    st.session_state.validation_active = active
+
+
+def display_validation_controls(controls_area, store):
+    """
+    Menampilkan kontrol selama validasi berjalan: download hasil sementara dan
+    tombol untuk menghentikan validasi
+    """
+    with controls_area.container():
+        # Isi file ekspor hanya dibaca saat diminta; rerun akibat download
+        # akan melanjutkan validasi secara otomatis
+        if st.session_state.pop('partial_export_requested', False) and os.path.exists(export_path(store)):
+            with open(export_path(store), 'rb') as csv_file:
+                st.download_button(
+                    label="Download Hasil Sementara sebagai CSV",
+                    data=csv_file,
+                    file_name="email_validation_results_partial.csv",
+                    mime="text/csv",
+                    key="partial_export"
+                )
+        col1, col2 = st.columns(2)
+        col1.button("Siapkan Download Hasil Sementara", key="prepare_partial_export", on_click=request_partial_export)
+        col2.button("Hentikan Validasi", key="stop_validation", on_click=set_validation_active, args=(False,))
+
+
+def validate_emails(results_area, controls_area, resume=False):
+    """
+    Fungsi untuk memvalidasi daftar email menggunakan API dan menyimpan hasilnya ke session state.
+    Hasil ditampilkan di results_area per micro-batch selama validasi berjalan.
+    """
+    if resume:
+        # Lanjutkan dari baris pertama yang belum tersimpan dengan rencana delta yang sama
+        store = st.session_state.validation_store
+        stats = st.session_state.validation_stats
+        plan = st.session_state.validation_plan
+        all_emails = st.session_state.validation_emails
+        carried = plan['carried']
+        emails, to_validate, done_api_calls = remaining_plan(
+            all_emails, plan['to_validate'], carried, len(store)
+        )
+    else:
+        if 'emails_to_validate' not in st.session_state:
+            st.error("Tidak ada email untuk divalidasi.")
+            return
+        
+        emails = st.session_state.emails_to_validate
+        if not emails:
+            st.error("Tidak ada email untuk divalidasi.")
+            return
+        
+        # Mode delta: teruskan verdict yang masih berlaku dari hasil sebelumnya
+        previous_results = st.session_state.get('previous_results')
+        if previous_results is not None:
+            to_validate, carried = plan_revalidation(
+                emails, previous_results, st.session_state.get('delta_max_age_days', 30)
+            )
+        else:
+            to_validate, carried = emails, {}
+        done_api_calls = 0
+        
+        # Hasil ditulis bertahap ke file kolumnar, bukan disimpan sebagai list dict
+        store = ResultStore.create(emails, keep_raw=st.session_state.get('keep_raw_payloads', False))
+        stats = ValidationStats()
+        
+        # Simpan segera agar validasi dapat dilanjutkan jika run terhenti
+        st.session_state.validation_store = store
+        st.session_state.validation_stats = stats
+        st.session_state.validation_emails = emails
+        st.session_state.validation_plan = {'to_validate': to_validate, 'carried': carried}
+        st.session_state.validation_active = True
+    
+    display_validation_controls(controls_area, store)
     
     # Inisialisasi progress bar
     progress_bar = st.progress(0)
     status_text = st.empty()
     
     results = []
-    total_emails = len(emails)
-    
-    for i, email in enumerate(emails):
-        # Update progress
-        progress = (i + 1) / total_emails
-        progress_bar.progress(progress)
-        status_text.text(f"Memvalidasi email {i+1}/{total_emails}: {email}")
-        
-        # Validasi email menggunakan API
-        result = validate_email(email, use_api=True)
-        results.append(result)
+    total_emails = len(st.session_state.validation_emails)
+    total_api_calls = len(st.session_state.validation_plan['to_validate'])
+    api_calls = done_api_calls
+    last_flush = time.monotonic()
+    
+    # Hasil validasi keluar berurutan sesuai to_validate
+    fresh_results = validate_email_list(to_validate)
+    
+    for email in emails:
+        # Gunakan hasil sebelumnya jika verdict masih berlaku
+        carried_result = carried.get(normalize_email(email))
+        if carried_result is not None:
+            # Email ditulis seperti pada input, termasuk duplikat dengan huruf berbeda
+            results.append({**carried_result, 'email': email})
+        else:
+            # Update progress
+            api_calls += 1
+            progress = api_calls / total_api_calls
+            progress_bar.progress(progress)
+            status_text.text(f"Memvalidasi email {api_calls}/{total_api_calls}: {email}")
+            
+            # Validasi email menggunakan API (delay antar call diatur oleh validator)
+            results.append(next(fresh_results))
         
-        # Tambahkan delay 1.5 detik antara setiap API call untuk menghindari rate limit
-        if i < total_emails - 1:  # Tidak perlu delay setelah email terakhir
-            time.sleep(1.5)
-    
-    # Simpan hasil validasi ke session state
-    st.session_state.validation_results = results
-    
-    # Reset progress bar dan status
+        # Tulis dan tampilkan micro-batch jika sudah penuh atau interval terlampaui
+        if len(results) >= STORE_BATCH_SIZE or time.monotonic() - last_flush >= STREAM_INTERVAL:
+            write_results(store, stats, results)
+            results = []
+            last_flush = time.monotonic()
+            if len(store) < store.capacity:
+                display_partial_results(results_area, store, stats)
+    
+    # Tulis sisa hasil
+    write_results(store, stats, results)
+    st.session_state.validation_active = False
+    
+    # Reset progress bar, status, dan kontrol validasi
     progress_bar.empty()
     status_text.empty()
+    controls_area.empty()
     
     # Pindah ke tab hasil
     st.session_state.active_tab = "Hasil"
     
     # Tampilkan notifikasi sukses
     st.success(f"Berhasil memvalidasi {total_emails} email!")
+    if carried:
+        st.info(f"Mode delta: {total_api_calls} email divalidasi ulang, "
+                f"{total_emails - total_api_calls} verdict diteruskan dari hasil sebelumnya.")
 
 
 if __name__ == "__main__":
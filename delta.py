@@ -0,0 +1,184 @@
+from datetime import datetime, timedelta
+import pandas as pd
+from result_store import ResultStore, API_BOOL_FIELDS, entry_to_api_validation
+from utils import normalize_email
+
+# Status deliverability yang selalu divalidasi ulang pada mode delta
+REVALIDATE_DELIVERABILITY = ['RISKY', 'UNKNOWN', 'FAILED']
+
+# Pemetaan kolom hasil format_csv_export() ke nama kolom internal
+EXPORT_COLUMN_MAP = {
+    'Email': 'email',
+    'Jenis Email': 'category',
+    'Status Deliverability': 'deliverability',
+    'Skor Kualitas (%)': 'quality_score',
+    'Format Email Valid': 'is_valid_format',
+    'Memiliki MX Record': 'has_mx_record',
+    'SMTP Valid': 'is_smtp_valid',
+    'Bukan Email Disposable': 'is_disposable',
+    'Email Layanan Gratis': 'is_free_email',
+    'Bukan Email Peran': 'is_role_email',
+    'Bukan Email Catchall': 'is_catchall',
+    'Saran Koreksi': 'autocorrect',
+    'Waktu Validasi': 'validated_at'
+}
+
+# Kolom ekspor yang nilainya dibalik ("Bukan ...") oleh format_csv_export()
+NEGATED_EXPORT_COLUMNS = ['Bukan Email Disposable', 'Bukan Email Peran', 'Bukan Email Catchall']
+
+
+def _parse_bool(value):
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ('ya', 'true', '1', 'yes')
+
+
+def _parse_quality_score(value):
+    try:
+        if isinstance(value, str) and value.strip().endswith('%'):
+            return float(value.strip().rstrip('%')) / 100
+        return float(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def load_previous_results(source):
+    """
+    Membaca file hasil validasi sebelumnya untuk mode delta.
+
+    Mendukung file CSV hasil format_csv_export(), CSV dengan nama kolom
+    internal (email, deliverability, quality_score, dst), maupun file run
+    .npy dari ResultStore.
+
+    Args:
+        source: Path atau file-like object berisi CSV hasil validasi,
+                path file .npy, atau ResultStore
+
+    Returns:
+        pandas.DataFrame: Hasil sebelumnya dengan nama kolom internal
+    """
+    if isinstance(source, str) and source.endswith('.npy'):
+        source = ResultStore(source)
+    if isinstance(source, ResultStore):
+        return source.to_dataframe()
+
+    df = pd.read_csv(source, dtype=str, keep_default_na=False)
+
+    if 'Email' in df.columns:
+        # Kembalikan nilai kolom "Bukan ..." ke arti aslinya
+        for col in NEGATED_EXPORT_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].apply(lambda x: not _parse_bool(x))
+        df = df.rename(columns=EXPORT_COLUMN_MAP)
+
+    if 'email' not in df.columns:
+        raise ValueError("File hasil sebelumnya harus memiliki kolom 'Email' atau 'email'.")
+
+    for col in API_BOOL_FIELDS:
+        if col in df.columns:
+            df[col] = df[col].apply(_parse_bool)
+
+    if 'quality_score' in df.columns:
+        df['quality_score'] = df['quality_score'].apply(_parse_quality_score)
+
+    if 'validated_at' not in df.columns:
+        df['validated_at'] = ''
+
+    return df
+
+
+def previous_row_to_result(row, email=None):
+    """
+    Mengubah satu baris hasil sebelumnya menjadi format hasil validate_email(),
+    sehingga dapat ditampilkan ulang tanpa memanggil API. Jika `email`
+    diberikan, email ditulis seperti pada input saat ini, bukan seperti di
+    file sebelumnya.
+    """
+    validated_at = row.get('validated_at', '')
+    if isinstance(validated_at, datetime):
+        validated_at = '' if pd.isna(validated_at) else validated_at.isoformat()
+
+    return {
+        'email': email if email is not None else row.get('email', ''),
+        'category': row.get('category', 'unknown'),
+        'api_validation': entry_to_api_validation(row),
+        'validated_at': validated_at,
+        'carried_forward': True
+    }
+
+
+def _is_expired(validated_at, max_age_days, now):
+    # Hasil tanpa waktu validasi dianggap kedaluwarsa
+    if isinstance(validated_at, datetime):
+        if pd.isna(validated_at):
+            return True
+        return now - validated_at > timedelta(days=max_age_days)
+    if not validated_at:
+        return True
+    try:
+        validated_time = datetime.fromisoformat(str(validated_at))
+    except ValueError:
+        return True
+    return now - validated_time > timedelta(days=max_age_days)
+
+
+def plan_revalidation(emails, previous_df, max_age_days=30, now=None):
+    """
+    Menentukan email mana yang perlu divalidasi ulang pada mode delta.
+
+    Email divalidasi ulang jika belum pernah divalidasi, verdict-nya sudah
+    kedaluwarsa, atau statusnya RISKY/UNKNOWN/FAILED. Email lainnya diteruskan
+    dari hasil sebelumnya tanpa perubahan.
+
+    Args:
+        emails (list): Daftar email yang akan divalidasi
+        previous_df (pandas.DataFrame): Hasil dari load_previous_results()
+        max_age_days (int): Masa berlaku verdict dalam hari
+        now (datetime): Waktu acuan, default waktu sekarang
+
+    Returns:
+        tuple: (list email yang perlu divalidasi, dict hasil yang diteruskan
+               dengan key email yang dinormalkan)
+    """
+    now = now or datetime.now()
+
+    previous = {}
+    for row in previous_df.to_dict('records'):
+        previous[normalize_email(row.get('email', ''))] = row
+
+    to_validate = []
+    carried = {}
+    for email in emails:
+        key = normalize_email(email)
+        row = previous.get(key)
+
+        if (row is None
+                or row.get('deliverability', 'UNKNOWN') in REVALIDATE_DELIVERABILITY
+                or _is_expired(row.get('validated_at'), max_age_days, now)):
+            to_validate.append(email)
+        else:
+            carried[key] = previous_row_to_result(row, email)
+
+    return to_validate, carried
+
+
+def remaining_plan(emails, to_validate, carried, done):
+    """
+    Menghitung sisa rencana validasi untuk melanjutkan run yang terhenti.
+
+    Baris hasil ditulis berurutan sesuai daftar email, sehingga `done` email
+    pertama sudah tersimpan. Email yang tidak ada di `carried` memakai satu
+    API call dan mengambil urutan berikutnya dari `to_validate`.
+
+    Args:
+        emails (list): Seluruh daftar email pada run
+        to_validate (list): Email yang perlu divalidasi dari plan_revalidation()
+        carried (dict): Hasil yang diteruskan dari plan_revalidation()
+        done (int): Jumlah hasil yang sudah tersimpan
+
+    Returns:
+        tuple: (email yang belum diproses, sisa email yang perlu divalidasi,
+               jumlah API call yang sudah dilakukan)
+    """
+    done_api_calls = sum(1 for email in emails[:done] if normalize_email(email) not in carried)
+    return emails[done:], to_validate[done_api_calls:], done_api_calls
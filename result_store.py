@@ -0,0 +1,364 @@
+import os
+import glob
+import json
+import zlib
+from datetime import datetime
+import numpy as np
+import pandas as pd
+
+# Direktori untuk menyimpan hasil setiap run validasi (dapat diatur lewat environment)
+RUNS_DIR = os.environ.get(
+    'EMAIL_VALIDATOR_RUNS_DIR',
+    os.path.join(os.path.expanduser('~'), '.email_validator', 'runs')
+)
+
+# Jumlah run terbaru yang disimpan; run yang lebih lama dihapus otomatis
+MAX_SAVED_RUNS = int(os.environ.get('EMAIL_VALIDATOR_MAX_RUNS', '20'))
+
+# Kode status deliverability; indeks 0 menandakan baris yang belum terisi
+DELIVERABILITY_CODES = ['', 'DELIVERABLE', 'RISKY', 'UNDELIVERABLE', 'UNKNOWN', 'FAILED']
+CATEGORY_CODES = ['unknown', 'personal', 'business']
+
+# Kolom boolean yang disimpan sebagai bit di kolom 'flags'
+FLAG_COLUMNS = [
+    'is_valid_format', 'is_free_email', 'is_disposable', 'is_role_email',
+    'is_catchall', 'has_mx_record', 'is_smtp_valid'
+]
+
+# Pemetaan kolom internal ke field boolean pada respons AbstractAPI
+API_BOOL_FIELDS = {
+    'is_valid_format': 'is_valid_format',
+    'is_free_email': 'is_free_email',
+    'is_disposable': 'is_disposable_email',
+    'is_role_email': 'is_role_email',
+    'is_catchall': 'is_catchall_email',
+    'has_mx_record': 'is_mx_found',
+    'is_smtp_valid': 'is_smtp_valid'
+}
+
+# Ruang tambahan untuk saran koreksi yang bisa lebih panjang dari email asli
+AUTOCORRECT_SLACK = 16
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def result_dtype(email_width, autocorrect_width=None):
+    """
+    Membuat dtype record fixed-width untuk satu hasil validasi.
+    """
+    autocorrect_width = autocorrect_width or email_width + AUTOCORRECT_SLACK
+    return np.dtype([
+        ('email', f'S{email_width}'),
+        ('autocorrect', f'S{autocorrect_width}'),
+        ('category', 'u1'),
+        ('deliverability', 'u1'),
+        ('flags', 'u1'),
+        ('quality_score', 'f4'),
+        ('validated_at', 'f8'),
+        ('raw_offset', 'i8'),
+        ('raw_length', 'i4')
+    ])
+
+
+def entry_to_api_validation(entry):
+    """
+    Menyusun ulang dict bergaya respons AbstractAPI dari kolom hasil validasi.
+    """
+    api_validation = {
+        'email': entry.get('email', ''),
+        'autocorrect': entry.get('autocorrect', ''),
+        'deliverability': entry.get('deliverability', 'UNKNOWN'),
+        'quality_score': entry.get('quality_score', 0)
+    }
+    for col, api_field in API_BOOL_FIELDS.items():
+        api_validation[api_field] = {'value': bool(entry.get(col, False))}
+    return api_validation
+
+
+def list_runs(runs_dir=RUNS_DIR):
+    """
+    Mengembalikan daftar path file run yang tersimpan, terbaru lebih dulu.
+    """
+    if not os.path.isdir(runs_dir):
+        return []
+    paths = [os.path.join(runs_dir, name) for name in os.listdir(runs_dir) if name.endswith('.npy')]
+    return sorted(paths, key=os.path.getmtime, reverse=True)
+
+
+def new_run_path(runs_dir=RUNS_DIR):
+    """
+    Membuat path file baru untuk menyimpan hasil satu run validasi.
+    """
+    os.makedirs(runs_dir, exist_ok=True)
+    return os.path.join(runs_dir, f"run-{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}.npy")
+
+
+def delete_run(path):
+    """
+    Menghapus file run beserta semua file pendampingnya (.raw, .csv, dst).
+    """
+    for run_file in glob.glob(glob.escape(os.path.splitext(path)[0]) + '.*'):
+        os.remove(run_file)
+
+
+def prune_runs(keep=MAX_SAVED_RUNS, runs_dir=RUNS_DIR):
+    """
+    Menghapus run tersimpan yang paling lama sehingga tersisa `keep` run terbaru.
+
+    Returns:
+        list: Path run yang dihapus
+    """
+    old_runs = list_runs(runs_dir)[keep:]
+    for path in old_runs:
+        delete_run(path)
+    return old_runs
+
+
+def _encode(value):
+    return str(value if value is not None else '').encode('utf-8')
+
+
+def _grown_width(current, needed):
+    # Lebar digandakan agar penulisan ulang file tidak terjadi di setiap batch
+    return current if needed <= current else max(needed, current * 2)
+
+
+def _to_timestamp(value):
+    # Waktu disimpan sebagai detik sejak epoch tanpa zona waktu (wall clock)
+    if not value:
+        return np.nan
+    try:
+        return (datetime.fromisoformat(str(value)) - _EPOCH).total_seconds()
+    except ValueError:
+        return np.nan
+
+
+class ResultStore:
+    """
+    Penyimpanan hasil validasi dalam format kolumnar fixed-width (.npy) yang
+    dibaca secara memory-mapped, dengan payload API mentah opsional yang
+    dikompresi zlib di file pendamping (.raw).
+    """
+
+    def __init__(self, path, mode='r'):
+        """
+        Membuka file hasil yang sudah ada.
+
+        Args:
+            path (str): Path file .npy
+            mode (str): 'r' untuk baca saja, 'r+' untuk menambah hasil
+        """
+        self.path = path
+        self.raw_path = path + '.raw'
+        self.records = np.load(path, mmap_mode=mode)
+        # Baris diisi berurutan, baris pertama yang kosong menandai akhir data
+        empty = np.flatnonzero(self.records['deliverability'] == 0)
+        self.count = int(empty[0]) if len(empty) else len(self.records)
+
+    @classmethod
+    def create(cls, emails, path=None, keep_raw=False):
+        """
+        Membuat file hasil baru dengan kapasitas sebanyak daftar email.
+
+        Args:
+            emails (list): Daftar email yang akan divalidasi
+            path (str): Path file .npy, default file baru di RUNS_DIR
+                        (run lama di luar MAX_SAVED_RUNS dihapus)
+            keep_raw (bool): Simpan payload API mentah (terkompresi)
+
+        Returns:
+            ResultStore: Store yang siap diisi dengan append()
+        """
+        if path is None:
+            path = new_run_path()
+            # Run baru sudah ada di daftar, sehingga hanya run lama yang terhapus
+            open(path, 'wb').close()
+            prune_runs()
+        width = max([len(_encode(email)) for email in emails] + [1])
+        records = np.lib.format.open_memmap(
+            path, mode='w+', dtype=result_dtype(width), shape=(len(emails),)
+        )
+        del records
+
+        if keep_raw:
+            open(path + '.raw', 'wb').close()
+
+        return cls(path, mode='r+')
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def capacity(self):
+        return len(self.records)
+
+    @property
+    def has_raw(self):
+        return os.path.exists(self.raw_path)
+
+    def append(self, entries, raw_payloads=None):
+        """
+        Menambahkan hasil validasi ke store.
+
+        Args:
+            entries (list): Hasil extract_api_data() untuk satu batch
+            raw_payloads (list): Payload API mentah per entry (opsional)
+        """
+        if not entries:
+            return
+
+        start = self.count
+        stop = start + len(entries)
+
+        # Field teks fixed-width dilebarkan agar nilai tidak terpotong diam-diam
+        emails = [_encode(entry.get('email', '')) for entry in entries]
+        autocorrects = [_encode(entry.get('autocorrect', '')) for entry in entries]
+        email_width = self.records.dtype['email'].itemsize
+        autocorrect_width = self.records.dtype['autocorrect'].itemsize
+        new_email_width = _grown_width(email_width, max(len(value) for value in emails))
+        new_autocorrect_width = _grown_width(autocorrect_width, max(len(value) for value in autocorrects))
+        if (new_email_width, new_autocorrect_width) != (email_width, autocorrect_width):
+            self._widen(new_email_width, new_autocorrect_width)
+
+        batch = np.zeros(len(entries), dtype=self.records.dtype)
+        batch['raw_offset'] = -1
+        batch['email'] = emails
+        batch['autocorrect'] = autocorrects
+
+        for i, entry in enumerate(entries):
+            category = entry.get('category', 'unknown')
+            batch['category'][i] = CATEGORY_CODES.index(category) if category in CATEGORY_CODES else 0
+            deliverability = entry.get('deliverability', 'UNKNOWN')
+            batch['deliverability'][i] = (
+                DELIVERABILITY_CODES.index(deliverability)
+                if deliverability in DELIVERABILITY_CODES[1:] else DELIVERABILITY_CODES.index('UNKNOWN')
+            )
+            try:
+                batch['quality_score'][i] = float(entry.get('quality_score') or 0)
+            except (TypeError, ValueError):
+                batch['quality_score'][i] = 0
+            batch['validated_at'][i] = _to_timestamp(entry.get('validated_at'))
+
+            flags = 0
+            for bit, col in enumerate(FLAG_COLUMNS):
+                if entry.get(col):
+                    flags |= 1 << bit
+            batch['flags'][i] = flags
+
+        if raw_payloads is not None and self.has_raw:
+            with open(self.raw_path, 'ab') as raw_file:
+                for i, payload in enumerate(raw_payloads):
+                    if payload is None:
+                        continue
+                    blob = zlib.compress(json.dumps(payload).encode('utf-8'))
+                    batch['raw_offset'][i] = raw_file.tell()
+                    batch['raw_length'][i] = len(blob)
+                    raw_file.write(blob)
+
+        self.records[start:stop] = batch
+        self.records.flush()
+        self.count = stop
+
+    def _widen(self, email_width, autocorrect_width):
+        """
+        Menulis ulang file dengan field email/autocorrect yang lebih lebar.
+        """
+        dtype = result_dtype(email_width, autocorrect_width)
+        tmp_path = self.path + '.tmp'
+        widened = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=dtype, shape=self.records.shape)
+        for name in dtype.names:
+            widened[name] = self.records[name]
+        widened.flush()
+        del widened
+
+        # Lepaskan memory map lama sebelum file diganti
+        self.records = None
+        os.replace(tmp_path, self.path)
+        self.records = np.load(self.path, mmap_mode='r+')
+
+    def to_dataframe(self, start=0, stop=None, columns=None):
+        """
+        Membaca rentang hasil sebagai DataFrame dengan kolom seperti extract_api_data().
+
+        Args:
+            start (int): Indeks awal
+            stop (int): Indeks akhir (eksklusif), default jumlah hasil
+            columns (list): Kolom yang dibutuhkan, default semua kolom
+
+        Returns:
+            pandas.DataFrame: Hasil validasi pada rentang tersebut
+        """
+        stop = self.count if stop is None else min(stop, self.count)
+        rows = self.records[start:stop]
+        columns = columns or (
+            ['email', 'category', 'validated_at', 'quality_score', 'deliverability']
+            + FLAG_COLUMNS + ['autocorrect']
+        )
+
+        data = {}
+        for col in columns:
+            if col in ('email', 'autocorrect'):
+                data[col] = np.char.decode(rows[col], 'utf-8').astype(object)
+            elif col == 'category':
+                data[col] = np.array(CATEGORY_CODES, dtype=object)[rows['category']]
+            elif col == 'deliverability':
+                data[col] = np.array(DELIVERABILITY_CODES, dtype=object)[rows['deliverability']]
+            elif col == 'quality_score':
+                data[col] = np.asarray(rows['quality_score'], dtype=float)
+            elif col == 'validated_at':
+                data[col] = pd.to_datetime(rows['validated_at'], unit='s')
+            elif col in FLAG_COLUMNS:
+                data[col] = (rows['flags'] & (1 << FLAG_COLUMNS.index(col))) != 0
+
+        return pd.DataFrame(data, index=pd.RangeIndex(start, stop))
+
+    def find(self, email):
+        """
+        Mencari indeks baris pertama dengan email tertentu langsung pada kolom
+        memory-mapped, tanpa membuat objek Python per baris.
+
+        Returns:
+            int: Indeks baris, atau None jika tidak ditemukan
+        """
+        encoded = _encode(email)
+        emails = self.records['email'][:self.count]
+        matches = np.flatnonzero(emails == encoded)
+        if not len(matches):
+            # Domain email tidak case-sensitive, coba pencocokan huruf kecil
+            matches = np.flatnonzero(np.char.lower(emails) == encoded.lower())
+        return int(matches[0]) if len(matches) else None
+
+    def get_raw(self, index):
+        """
+        Membaca payload API mentah untuk satu baris, atau None jika tidak disimpan.
+        """
+        record = self.records[index]
+        if record['raw_offset'] < 0 or not self.has_raw:
+            return None
+        with open(self.raw_path, 'rb') as raw_file:
+            raw_file.seek(int(record['raw_offset']))
+            blob = raw_file.read(int(record['raw_length']))
+        return json.loads(zlib.decompress(blob).decode('utf-8'))
+
+    def get_result(self, index):
+        """
+        Membaca satu hasil dalam format validate_email().
+
+        Payload API mentah digunakan jika tersedia; jika tidak, payload disusun
+        ulang dari kolom yang tersimpan.
+        """
+        entry = self.to_dataframe(index, index + 1).iloc[0].to_dict()
+        validated_at = entry['validated_at']
+        entry['validated_at'] = '' if pd.isna(validated_at) else validated_at.isoformat()
+
+        if entry['deliverability'] == 'FAILED':
+            api_validation = None
+        else:
+            api_validation = self.get_raw(index) or entry_to_api_validation(entry)
+
+        return {
+            'email': entry['email'],
+            'category': entry['category'],
+            'api_validation': api_validation,
+            'validated_at': entry['validated_at']
+        }
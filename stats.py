@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+
+# Kolom boolean yang dihitung untuk dashboard
+STAT_FLAG_COLUMNS = [
+    'is_valid_format', 'has_mx_record', 'is_smtp_valid',
+    'is_disposable', 'is_role_email', 'is_catchall'
+]
+
+# Kolom yang dibutuhkan untuk menghitung agregat
+STATS_COLUMNS = ['category', 'quality_score', 'deliverability'] + STAT_FLAG_COLUMNS
+
+# Jumlah bin histogram quality score pada rentang 0-1
+QUALITY_BINS = 10
+
+
+class ValidationStats:
+    """
+    Agregat dashboard yang diperbarui secara inkremental per batch hasil,
+    sehingga tidak perlu menghitung ulang seluruh hasil setiap kali dashboard
+    ditampilkan.
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.deliverability_counts = {}
+        self.category_counts = {}
+        self.flag_counts = {col: 0 for col in STAT_FLAG_COLUMNS}
+        self.quality_histogram = np.zeros(QUALITY_BINS, dtype=np.int64)
+
+    @classmethod
+    def from_store(cls, store, batch_size=100000):
+        """
+        Menghitung agregat dari seluruh hasil di ResultStore, per blok.
+        """
+        stats = cls()
+        for start in range(0, len(store), batch_size):
+            stats.update(store.to_dataframe(start, start + batch_size, columns=STATS_COLUMNS))
+        return stats
+
+    def update(self, df):
+        """
+        Menambahkan satu batch hasil ke agregat.
+
+        Args:
+            df (pandas.DataFrame): Batch hasil dengan kolom STATS_COLUMNS
+        """
+        if df.empty:
+            return
+
+        self.total += len(df)
+
+        for key, count in df['deliverability'].value_counts().items():
+            self.deliverability_counts[key] = self.deliverability_counts.get(key, 0) + int(count)
+        for key, count in df['category'].value_counts().items():
+            self.category_counts[key] = self.category_counts.get(key, 0) + int(count)
+
+        for col in STAT_FLAG_COLUMNS:
+            self.flag_counts[col] += int(df[col].fillna(False).astype(bool).sum())
+
+        scores = pd.to_numeric(df['quality_score'], errors='coerce').fillna(0).clip(0, 1)
+        self.quality_histogram += np.histogram(scores, bins=QUALITY_BINS, range=(0, 1))[0]
+
+    def histogram_frame(self):
+        """
+        Mengembalikan histogram quality score sebagai DataFrame untuk chart.
+        """
+        edges = np.linspace(0, 1, QUALITY_BINS + 1)
+        return pd.DataFrame({
+            'quality_score': [f"{edges[i]:.1f}-{edges[i + 1]:.1f}" for i in range(QUALITY_BINS)],
+            'count': self.quality_histogram
+        })
+
@@ -0,0 +1,155 @@
+import io
+from datetime import datetime
+
+import pandas as pd
+
+from app import format_csv_export
+from delta import load_previous_results, plan_revalidation, remaining_plan, normalize_email
+
+NOW = datetime(2026, 10, 19, 12, 0, 0)
+
+
+def make_results_df():
+    return pd.DataFrame([
+        {
+            'email': 'fresh@example.com', 'category': 'business', 'validated_at': '2026-10-10T10:00:00',
+            'quality_score': 0.85, 'deliverability': 'DELIVERABLE', 'is_valid_format': True,
+            'is_free_email': False, 'is_disposable': False, 'is_role_email': True,
+            'is_catchall': False, 'has_mx_record': True, 'is_smtp_valid': True, 'autocorrect': ''
+        },
+        {
+            'email': 'Risky@Example.com', 'category': 'business', 'validated_at': '2026-10-10T10:00:00',
+            'quality_score': 0.5, 'deliverability': 'RISKY', 'is_valid_format': True,
+            'is_free_email': False, 'is_disposable': True, 'is_role_email': False,
+            'is_catchall': True, 'has_mx_record': True, 'is_smtp_valid': False, 'autocorrect': ''
+        },
+        {
+            'email': 'old@example.com', 'category': 'personal', 'validated_at': '2026-01-01T10:00:00',
+            'quality_score': 0.1, 'deliverability': 'UNDELIVERABLE', 'is_valid_format': True,
+            'is_free_email': True, 'is_disposable': False, 'is_role_email': False,
+            'is_catchall': False, 'has_mx_record': False, 'is_smtp_valid': False, 'autocorrect': ''
+        },
+    ])
+
+
+def export_csv(df):
+    return io.StringIO(format_csv_export(df).to_csv(index=False))
+
+
+def test_export_round_trip_restores_inverted_columns():
+    previous = load_previous_results(export_csv(make_results_df()))
+
+    fresh = previous[previous['email'] == 'fresh@example.com'].iloc[0]
+    assert bool(fresh['is_role_email']) is True
+    assert bool(fresh['is_disposable']) is False
+    assert bool(fresh['is_catchall']) is False
+    assert bool(fresh['is_free_email']) is False
+
+    risky = previous[previous['email'] == 'Risky@Example.com'].iloc[0]
+    assert bool(risky['is_disposable']) is True
+    assert bool(risky['is_catchall']) is True
+    assert bool(risky['is_smtp_valid']) is False
+
+
+def test_export_round_trip_parses_percentage_and_timestamp():
+    previous = load_previous_results(export_csv(make_results_df()))
+
+    assert previous['quality_score'].tolist() == [0.85, 0.5, 0.1]
+    assert previous['validated_at'].tolist()[0] == '2026-10-10T10:00:00'
+
+
+def test_load_internal_column_names():
+    csv = "email,deliverability,quality_score\nuser@example.com,DELIVERABLE,0.9\n"
+    previous = load_previous_results(io.StringIO(csv))
+
+    assert previous['quality_score'].tolist() == [0.9]
+    assert previous['validated_at'].tolist() == ['']
+
+
+def test_plan_revalidation():
+    previous = load_previous_results(export_csv(make_results_df()))
+    emails = ['FRESH@example.com', 'risky@example.com', 'old@example.com', 'new@example.com']
+
+    to_validate, carried = plan_revalidation(emails, previous, max_age_days=30, now=NOW)
+
+    assert to_validate == ['risky@example.com', 'old@example.com', 'new@example.com']
+    assert list(carried) == [normalize_email('FRESH@example.com')]
+
+    result = carried['fresh@example.com']
+    assert result['carried_forward'] is True
+    assert result['api_validation']['deliverability'] == 'DELIVERABLE'
+    assert result['api_validation']['is_role_email'] == {'value': True}
+    assert result['validated_at'] == '2026-10-10T10:00:00'
+
+
+def test_plan_revalidation_treats_missing_timestamp_as_expired():
+    csv = "email,deliverability\nuser@example.com,DELIVERABLE\n"
+    previous = load_previous_results(io.StringIO(csv))
+
+    to_validate, carried = plan_revalidation(['user@example.com'], previous, now=NOW)
+
+    assert to_validate == ['user@example.com']
+    assert carried == {}
+
+
+def test_plan_revalidation_always_revalidates_failed():
+    csv = "email,deliverability,validated_at\nuser@example.com,FAILED,2026-10-18T10:00:00\n"
+    previous = load_previous_results(io.StringIO(csv))
+
+    to_validate, carried = plan_revalidation(['user@example.com'], previous, now=NOW)
+
+    assert to_validate == ['user@example.com']
+
+
+def pair_results(emails, to_validate, carried):
+    # Meniru loop validate_emails(): email baru mengambil hasil berikutnya dari to_validate
+    fresh = iter(to_validate)
+    return [(email, 'carried' if normalize_email(email) in carried else next(fresh)) for email in emails]
+
+
+def test_remaining_plan_resumes_at_every_offset():
+    previous = load_previous_results(export_csv(make_results_df()))
+    # Campuran hasil diteruskan dan baru, duplikat, dan perbedaan huruf besar
+    emails = [
+        'new1@example.com', 'FRESH@example.com', 'risky@example.com', 'fresh@example.com',
+        'New1@Example.com', 'old@example.com', 'Fresh@Example.com ', 'new2@example.com'
+    ]
+    to_validate, carried = plan_revalidation(emails, previous, max_age_days=30, now=NOW)
+    full_run = pair_results(emails, to_validate, carried)
+
+    for done in range(len(emails) + 1):
+        remaining_emails, remaining_to_validate, done_api_calls = remaining_plan(
+            emails, to_validate, carried, done
+        )
+
+        assert remaining_emails == emails[done:]
+        assert done_api_calls == sum(1 for _, source in full_run[:done] if source != 'carried')
+        assert full_run[:done] + pair_results(remaining_emails, remaining_to_validate, carried) == full_run
+
+
+def test_remaining_plan_pairs_each_email_with_its_own_verdict():
+    previous = load_previous_results(export_csv(make_results_df()))
+    emails = ['fresh@example.com', 'a@example.com', 'FRESH@example.com', 'A@example.com', 'b@example.com']
+    to_validate, carried = plan_revalidation(emails, previous, max_age_days=30, now=NOW)
+
+    remaining_emails, remaining_to_validate, done_api_calls = remaining_plan(emails, to_validate, carried, 3)
+
+    assert done_api_calls == 1
+    assert remaining_emails == ['A@example.com', 'b@example.com']
+    assert remaining_to_validate == ['A@example.com', 'b@example.com']
+
+
+def test_remaining_plan_without_delta():
+    emails = ['a@example.com', 'b@example.com', 'c@example.com']
+
+    assert remaining_plan(emails, emails, {}, 2) == (['c@example.com'], ['c@example.com'], 2)
+    assert remaining_plan(emails, emails, {}, 3) == ([], [], 3)
+
+
+def test_carried_result_uses_email_from_current_input():
+    previous = load_previous_results(export_csv(make_results_df()))
+
+    _, carried = plan_revalidation(['Fresh@Example.com'], previous, max_age_days=30, now=NOW)
+
+    assert carried['fresh@example.com']['email'] == 'Fresh@Example.com'
+    assert carried['fresh@example.com']['api_validation']['email'] == 'fresh@example.com'
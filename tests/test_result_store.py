@@ -0,0 +1,95 @@
+import os
+
+import numpy as np
+
+from result_store import ResultStore, FLAG_COLUMNS, list_runs, prune_runs, delete_run
+
+
+def make_entry(email, deliverability='DELIVERABLE', **flags):
+    entry = {
+        'email': email, 'category': 'business', 'validated_at': '2026-10-10T10:00:00',
+        'quality_score': 0.8, 'deliverability': deliverability, 'autocorrect': ''
+    }
+    entry.update({col: False for col in FLAG_COLUMNS})
+    entry.update(flags)
+    return entry
+
+
+def test_flags_round_trip(tmp_path):
+    store = ResultStore.create(['a@example.com', 'b@example.com'], path=str(tmp_path / 'run.npy'))
+    store.append([
+        make_entry('a@example.com', is_valid_format=True, is_smtp_valid=True),
+        make_entry('b@example.com', is_disposable=True, is_catchall=True, has_mx_record=True),
+    ])
+
+    df = store.to_dataframe()
+    assert df.loc[0, FLAG_COLUMNS].tolist() == [True, False, False, False, False, False, True]
+    assert df.loc[1, FLAG_COLUMNS].tolist() == [False, False, True, False, True, True, False]
+    assert df['quality_score'].tolist() == [np.float32(0.8), np.float32(0.8)]
+    assert str(df.loc[0, 'validated_at']) == '2026-10-10 10:00:00'
+
+
+def test_reopen_stops_at_first_empty_row(tmp_path):
+    path = str(tmp_path / 'run.npy')
+    store = ResultStore.create(['a@example.com', 'b@example.com', 'c@example.com'], path=path)
+    store.append([make_entry('a@example.com'), make_entry('b@example.com', 'FAILED')])
+
+    reopened = ResultStore(path)
+    assert len(reopened) == 2
+    assert reopened.capacity == 3
+    assert reopened.to_dataframe()['deliverability'].tolist() == ['DELIVERABLE', 'FAILED']
+
+
+def test_long_values_widen_fields_instead_of_truncating(tmp_path):
+    path = str(tmp_path / 'run.npy')
+    store = ResultStore.create(['a@b.co'], path=path)
+    long_email = 'pérsonne.très.longue@exämple.com'
+    store.append([dict(make_entry(long_email), autocorrect='ü' * 40)])
+
+    df = ResultStore(path).to_dataframe()
+    assert df.loc[0, 'email'] == long_email
+    assert df.loc[0, 'autocorrect'] == 'ü' * 40
+
+
+def test_find_and_get_result(tmp_path):
+    path = str(tmp_path / 'run.npy')
+    store = ResultStore.create(['A@example.com', 'b@example.com'], path=path, keep_raw=True)
+    store.append(
+        [make_entry('A@example.com', is_role_email=True), make_entry('b@example.com', 'FAILED')],
+        [{'email': 'A@example.com', 'deliverability': 'DELIVERABLE', 'domain': {'name': 'example.com'}}, None]
+    )
+
+    assert store.find('A@example.com') == 0
+    assert store.find('a@example.com') == 0
+    assert store.find('missing@example.com') is None
+
+    assert store.get_result(0)['api_validation']['domain'] == {'name': 'example.com'}
+    assert store.get_result(1)['api_validation'] is None
+
+
+def test_get_result_without_raw_rebuilds_payload(tmp_path):
+    store = ResultStore.create(['a@example.com'], path=str(tmp_path / 'run.npy'))
+    store.append([make_entry('a@example.com', is_role_email=True)])
+
+    api_validation = store.get_result(0)['api_validation']
+    assert api_validation['deliverability'] == 'DELIVERABLE'
+    assert api_validation['is_role_email'] == {'value': True}
+
+
+def test_prune_runs_keeps_newest(tmp_path):
+    runs_dir = str(tmp_path)
+    paths = []
+    for i in range(3):
+        path = os.path.join(runs_dir, f'run-{i}.npy')
+        ResultStore.create(['a@example.com'], path=path, keep_raw=True)
+        os.utime(path, (i, i))
+        paths.append(path)
+
+    removed = prune_runs(keep=2, runs_dir=runs_dir)
+
+    assert removed == [paths[0]]
+    assert list_runs(runs_dir) == [paths[2], paths[1]]
+    assert not os.path.exists(paths[0] + '.raw')
+
+    delete_run(paths[1])
+    assert list_runs(runs_dir) == [paths[2]]
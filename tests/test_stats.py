@@ -0,0 +1,77 @@
+import pandas as pd
+
+from result_store import ResultStore, FLAG_COLUMNS
+from stats import ValidationStats, STATS_COLUMNS
+
+
+def make_df(rows):
+    df = pd.DataFrame(rows)
+    for col in STATS_COLUMNS:
+        if col not in df.columns:
+            df[col] = False
+    return df[STATS_COLUMNS]
+
+
+ROWS = [
+    {'category': 'business', 'quality_score': 0.0, 'deliverability': 'DELIVERABLE', 'is_valid_format': True},
+    {'category': 'personal', 'quality_score': 0.05, 'deliverability': 'RISKY', 'is_disposable': True},
+    {'category': 'business', 'quality_score': 0.95, 'deliverability': 'DELIVERABLE', 'has_mx_record': True},
+    {'category': 'business', 'quality_score': 1.0, 'deliverability': 'FAILED', 'is_valid_format': True},
+]
+
+
+def test_incremental_update_matches_single_update():
+    incremental = ValidationStats()
+    incremental.update(make_df(ROWS[:1]))
+    incremental.update(make_df(ROWS[1:3]))
+    incremental.update(make_df(ROWS[3:]))
+
+    full = ValidationStats()
+    full.update(make_df(ROWS))
+
+    assert incremental.total == full.total == 4
+    assert incremental.deliverability_counts == full.deliverability_counts == {
+        'DELIVERABLE': 2, 'RISKY': 1, 'FAILED': 1
+    }
+    assert incremental.category_counts == {'business': 3, 'personal': 1}
+    assert incremental.flag_counts == full.flag_counts
+    assert incremental.flag_counts['is_valid_format'] == 2
+    assert incremental.quality_histogram.tolist() == full.quality_histogram.tolist()
+
+
+def test_quality_histogram_bins():
+    stats = ValidationStats()
+    stats.update(make_df(ROWS))
+
+    # 0.0 dan 0.05 di bin pertama, 0.95 dan 1.0 di bin terakhir
+    assert stats.quality_histogram.tolist() == [2, 0, 0, 0, 0, 0, 0, 0, 0, 2]
+
+    frame = stats.histogram_frame()
+    assert frame['quality_score'].tolist()[0] == '0.0-0.1'
+    assert frame['count'].sum() == 4
+
+
+def test_empty_batch_is_ignored():
+    stats = ValidationStats()
+    stats.update(make_df(ROWS).iloc[0:0])
+
+    assert stats.total == 0
+    assert stats.deliverability_counts == {}
+
+
+def test_from_store_reads_in_blocks(tmp_path):
+    store = ResultStore.create([f'user{i}@example.com' for i in range(5)], path=str(tmp_path / 'run.npy'))
+    entries = []
+    for i in range(5):
+        entry = {'email': f'user{i}@example.com', 'category': 'business', 'quality_score': 0.5,
+                 'deliverability': 'DELIVERABLE' if i % 2 else 'UNDELIVERABLE'}
+        entry.update({col: i % 2 == 0 for col in FLAG_COLUMNS})
+        entries.append(entry)
+    store.append(entries)
+
+    stats = ValidationStats.from_store(store, batch_size=2)
+
+    assert stats.total == 5
+    assert stats.deliverability_counts == {'UNDELIVERABLE': 3, 'DELIVERABLE': 2}
+    assert stats.flag_counts['is_disposable'] == 3
+    assert stats.quality_histogram.tolist()[5] == 5
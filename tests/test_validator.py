@@ -0,0 +1,105 @@
+import json
+from urllib.parse import urlsplit, parse_qs
+
+import pytest
+import requests
+
+import validator
+from validator import validate_email_list
+
+
+class RecordingSession(requests.Session):
+    """
+    Session palsu yang mencatat URL request dan membalas dengan payload AbstractAPI.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.urls = []
+
+    def send(self, request, **kwargs):
+        self.urls.append(request.url)
+        email = parse_qs(urlsplit(request.url).query)['email'][0]
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps({'email': email, 'deliverability': 'DELIVERABLE'}).encode('utf-8')
+        response.request = request
+        return response
+
+
+@pytest.fixture
+def sessions(monkeypatch):
+    created = []
+
+    def make_session():
+        created.append(RecordingSession())
+        return created[-1]
+
+    monkeypatch.setattr(validator.requests, 'Session', make_session)
+    return created
+
+
+def test_email_is_encoded_in_query_string(sessions):
+    emails = ['first+tag@example.com', 'a&b=c@example.com']
+    results = list(validate_email_list(emails, delay=0))
+
+    query = urlsplit(sessions[0].urls[0]).query
+    assert 'email=first%2Btag%40example.com' in query
+    assert 'email=a%26b%3Dc%40example.com' in sessions[0].urls[1]
+    assert parse_qs(query)['email'] == ['first+tag@example.com']
+    assert [r['api_validation']['email'] for r in results] == emails
+
+
+def test_all_calls_go_through_one_session(sessions):
+    emails = [f'user{i}@example.com' for i in range(5)]
+    results = list(validate_email_list(emails, delay=0))
+
+    assert len(sessions) == 1
+    assert len(sessions[0].urls) == len(emails)
+    assert [r['email'] for r in results] == emails
+
+
+def test_batch_backend_results_are_matched_by_normalized_email(sessions):
+    calls = []
+
+    def backend(chunk, session):
+        calls.append(list(chunk))
+        return {email.strip().lower(): {'deliverability': 'DELIVERABLE'} for email in chunk}
+
+    emails = ['A@Example.com', 'b@example.com', ' C@example.com']
+    results = list(validate_email_list(emails, delay=0, batch_backend=backend, batch_size=2))
+
+    assert calls == [['A@Example.com', 'b@example.com'], [' C@example.com']]
+    assert [r['email'] for r in results] == emails
+    assert all(r['api_validation'] == {'deliverability': 'DELIVERABLE'} for r in results)
+    assert sessions[0].urls == []
+
+
+def test_batch_backend_chunk_is_never_rebilled(sessions):
+    def partial_backend(chunk, session):
+        # Hanya sebagian email yang mendapat hasil
+        return {'a@example.com': {'deliverability': 'RISKY'}}
+
+    results = list(validate_email_list(['a@example.com', 'b@example.com'], delay=0, batch_backend=partial_backend))
+    assert results[0]['api_validation'] == {'deliverability': 'RISKY'}
+    assert results[1]['api_validation'] is None
+
+    def failing_backend(chunk, session):
+        raise requests.exceptions.Timeout('polling timeout')
+
+    results = list(validate_email_list(['c@example.com'], delay=0, batch_backend=failing_backend))
+    assert results[0]['api_validation'] is None
+
+    # Tidak ada email yang divalidasi ulang satu per satu
+    assert all(session.urls == [] for session in sessions)
+
+
+def test_unsupported_chunk_falls_back_to_individual_calls(sessions):
+    def backend(chunk, session):
+        return None
+
+    emails = ['x@example.com', 'y@example.com']
+    results = list(validate_email_list(emails, delay=0, batch_backend=backend))
+
+    assert len(sessions[0].urls) == 2
+    assert [r['api_validation']['email'] for r in results] == emails
@@ -27,4 +27,17 @@ def categorize_email(email):
         else:
             return 'business'
     except:
-        return 'unknown' 
\ No newline at end of file
+        return 'unknown' 
+
+def normalize_email(email):
+    """
+    Menormalkan alamat email agar bisa dicocokkan dengan hasil lain
+    (hasil sebelumnya atau hasil batch).
+    
+    Args:
+        email (str): Alamat email yang akan dinormalkan
+        
+    Returns:
+        str: Email tanpa spasi di tepi dan dalam huruf kecil
+    """
+    return str(email).strip().lower()
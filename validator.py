@@ -1,20 +1,30 @@
+import time
 import requests
-from utils import categorize_email
+from datetime import datetime
+from utils import categorize_email, normalize_email
 
-def validate_with_abstractapi(email, api_key="bb5407401a0f45bcaffbe59a080d393c"):
+ABSTRACTAPI_URL = "https://emailvalidation.abstractapi.com/v1/"
+DEFAULT_API_KEY = "bb5407401a0f45bcaffbe59a080d393c"
+
+# Jumlah email per chunk yang dikirim ke batch backend
+BATCH_SIZE = 50
+
+def validate_with_abstractapi(email, api_key=DEFAULT_API_KEY, session=None):
     """
     Memvalidasi email menggunakan AbstractAPI Email Validation.
     
     Args:
         email (str): Alamat email yang akan divalidasi
         api_key (str): API key untuk AbstractAPI
+        session (requests.Session): Session HTTP yang dipakai ulang (opsional)
         
     Returns:
         dict: Hasil validasi dari API atau None jika terjadi error
     """
     try:
-        url = f"https://emailvalidation.abstractapi.com/v1/?api_key={api_key}&email={email}"
-        response = requests.get(url, timeout=10)  # Tambahkan timeout untuk menghindari hanging
+        http = session or requests
+        # Gunakan params agar email di-encode dengan benar pada query string
+        response = http.get(ABSTRACTAPI_URL, params={'api_key': api_key, 'email': email}, timeout=10)  # Tambahkan timeout untuk menghindari hanging
         
         if response.status_code == 200:
             return response.json()
@@ -31,13 +41,14 @@ def validate_with_abstractapi(email, api_key="bb5407401a0f45bcaffbe59a080d393c")
         print(f"Error validasi AbstractAPI untuk email {email}: {e}")
         return None
 
-def validate_email(email, use_api=True):
+def validate_email(email, use_api=True, session=None):
     """
     Melakukan validasi email menggunakan AbstractAPI.
     
     Args:
         email (str): Alamat email yang akan divalidasi
         use_api (bool): Parameter untuk backward compatibility, sekarang selalu menggunakan API
+        session (requests.Session): Session HTTP yang dipakai ulang (opsional)
         
     Returns:
         dict: Hasil validasi lengkap
@@ -47,18 +58,91 @@ def validate_email(email, use_api=True):
         return {
             'email': str(email),
             'category': 'unknown',
-            'api_validation': None
+            'api_validation': None,
+            'validated_at': datetime.now().isoformat(timespec='seconds')
         }
     
     # Kategorikan email (personal/business) berdasarkan domain
     category = categorize_email(email)
     
     # Validasi menggunakan API
-    api_validation = validate_with_abstractapi(email)
+    api_validation = validate_with_abstractapi(email, session=session)
     
     # Hasil validasi
     return {
         'email': email,
         'category': category,
-        'api_validation': api_validation
-    } 
\ No newline at end of file
+        'api_validation': api_validation,
+        'validated_at': datetime.now().isoformat(timespec='seconds')
+    }
+
+def _validate_individually(emails, session, delay):
+    """
+    Jalur default: memvalidasi email satu per satu dengan jeda antar API call.
+    """
+    for i, email in enumerate(emails):
+        # Tidak perlu delay sebelum email pertama
+        if delay and i > 0:
+            time.sleep(delay)
+        yield validate_email(email, use_api=True, session=session)
+
+def _submit_batch(batch_backend, chunk, session):
+    """
+    Mengirim satu chunk ke batch backend.
+    
+    Returns:
+        dict: Payload API per email yang dinormalkan, atau None jika backend
+              tidak memproses chunk ini (belum ada yang ditagih)
+    """
+    try:
+        return batch_backend(chunk, session=session)
+    except Exception as e:
+        # Chunk mungkin sudah terkirim, jadi tidak divalidasi ulang satu per satu
+        print(f"Error batch backend untuk {len(chunk)} email: {e}")
+        return {}
+
+def validate_email_list(emails, delay=1.5, batch_backend=None, batch_size=BATCH_SIZE):
+    """
+    Memvalidasi daftar email melalui satu session HTTP yang dipakai ulang,
+    dengan urutan hasil sama seperti input.
+    
+    Tanpa batch_backend setiap email divalidasi satu per satu. Dengan
+    batch_backend, email dikirim per chunk berisi batch_size email; backend
+    dipanggil sebagai batch_backend(chunk, session=session) dan mengembalikan
+    dict payload API (format AbstractAPI) dengan key normalize_email(email),
+    atau None jika chunk tersebut tidak didukung sehingga divalidasi satu per
+    satu. Chunk yang sudah mendapat hasil tidak pernah divalidasi ulang; email
+    yang tidak ada di hasil backend ditandai gagal (api_validation None).
+    
+    Args:
+        emails (list): Daftar email yang akan divalidasi
+        delay (float): Jeda antar API call (atau antar chunk) untuk menghindari rate limit
+        batch_backend (callable): Backend bulk submit + polling (opsional)
+        batch_size (int): Jumlah email per chunk untuk batch_backend
+        
+    Yields:
+        dict: Hasil validasi lengkap per email
+    """
+    with requests.Session() as session:
+        if batch_backend is None:
+            yield from _validate_individually(emails, session, delay)
+            return
+        
+        for start in range(0, len(emails), batch_size):
+            if delay and start > 0:
+                time.sleep(delay)
+            
+            chunk = emails[start:start + batch_size]
+            payloads = _submit_batch(batch_backend, chunk, session)
+            if payloads is None:
+                yield from _validate_individually(chunk, session, delay)
+                continue
+            
+            validated_at = datetime.now().isoformat(timespec='seconds')
+            for email in chunk:
+                yield {
+                    'email': email,
+                    'category': categorize_email(email),
+                    'api_validation': payloads.get(normalize_email(email)),
+                    'validated_at': validated_at
+                }